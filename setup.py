@@ -1,10 +1,12 @@
 import io
-import sys
+import re
 
 from setuptools import setup
 
-sys.path.insert(0, '.')
-version = __import__('voluptuous').__version__
+# Read the version without importing the package, which would pull in
+# every validator module just to get at a string.
+with io.open('voluptuous/__init__.py', encoding='utf-8') as f:
+    version = re.search(r"^__version__ = '([^']+)'", f.read(), re.M).group(1)
 
 
 with io.open('README.md', encoding='utf-8') as f:
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import collections
+import copy
 import inspect
-import itertools
+import math
 import re
 import sys
 import typing
@@ -26,7 +27,20 @@ def _isnamedtuple(obj):
     return isinstance(obj, tuple) and hasattr(obj, '_fields')
 
 
+def _rebuild_sequence(data, out):
+    """Return the validated items in out as a sequence of data's type."""
+    # out is freshly built, so a plain list needs no copy.
+    if type(data) is list:
+        return out
+    elif _isnamedtuple(data):
+        return type(data)(*out)
+    else:
+        return type(data)(out)
+
+
 class Undefined(object):
+    __slots__ = ()
+
     def __nonzero__(self):
         return False
 
@@ -75,6 +89,52 @@ def Extra(_) -> None:
 extra = Extra
 
 primitive_types = (bool, bytes, int, str, float, complex)
+# Exact-type membership tests use these instead of scanning the tuple.
+_primitive_type_set = frozenset(primitive_types)
+_scalar_type_set = _primitive_type_set | {object, type(None)}
+# Schemas of these types compile to a plain equality check.
+_literal_type_set = _primitive_type_set | {type(None)}
+# Containers _freeze knows how to turn into cache keys.
+_container_type_set = frozenset((dict, list, tuple, set, frozenset))
+
+
+def _freeze(data, _parents=None):
+    """Return a hashable key identifying ``data`` by both value and type.
+
+    Raises ``TypeError`` for data that can't safely be used as a cache key,
+    including self-referencing containers.
+    """
+    type_ = type(data)
+    # 0.0 == -0.0, so floats and complex numbers carry their signs as well.
+    if type_ is float:
+        return type_, data, math.copysign(1.0, data)
+    if type_ is complex:
+        return (
+            type_,
+            data,
+            math.copysign(1.0, data.real),
+            math.copysign(1.0, data.imag),
+        )
+    if type_ in _primitive_type_set or data is None:
+        return type_, data
+    if type_ in _container_type_set:
+        if _parents is None:
+            _parents = set()
+        elif id(data) in _parents:
+            raise TypeError('self-referencing %s is not cacheable' % type_.__name__)
+        _parents.add(id(data))
+        if type_ is dict:
+            key = tuple(
+                (_freeze(k, _parents), _freeze(v, _parents)) for k, v in data.items()
+            )
+        elif type_ is list or type_ is tuple:
+            key = tuple(_freeze(v, _parents) for v in data)
+        else:
+            key = frozenset(_freeze(v, _parents) for v in data)
+        _parents.discard(id(data))
+        return type_, key
+    raise TypeError('%s is not cacheable' % type_.__name__)
+
 
 # fmt: off
 Schemable = typing.Union[
@@ -109,14 +169,39 @@ class Schema(object):
 
     """
 
+    __slots__ = (
+        'schema',
+        'required',
+        'extra',
+        'cache_size',
+        '_cache',
+        '_compile_cache',
+        '_compiled',
+        '__weakref__',
+    )
+
     _extra_to_name = {
         REMOVE_EXTRA: 'REMOVE_EXTRA',
         ALLOW_EXTRA: 'ALLOW_EXTRA',
         PREVENT_EXTRA: 'PREVENT_EXTRA',
     }
 
+    # Compile methods for the builtin container types, looked up by exact
+    # type so the common schemas skip the isinstance chain in _compile.
+    _compile_by_type = {
+        dict: '_compile_dict',
+        list: '_compile_list',
+        tuple: '_compile_tuple',
+        set: '_compile_set',
+        frozenset: '_compile_set',
+    }
+
     def __init__(
-        self, schema: Schemable, required: bool = False, extra: int = PREVENT_EXTRA
+        self,
+        schema: Schemable,
+        required: bool = False,
+        extra: int = PREVENT_EXTRA,
+        cache_size: int = 0,
     ) -> None:
         """Create a new Schema.
 
@@ -131,11 +216,29 @@ class Schema(object):
               from the output.
             - Any value other than the above defaults to
               :const:`~voluptuous.PREVENT_EXTRA`
+        :param cache_size: Remember the results of up to this many recent
+            successful validations, keyed on the value and type of the data.
+            Only data made of dicts, lists, tuples, sets and primitive values
+            is cached. Every call walks the data to build the key and every
+            hit deep-copies the stored result, so this only pays off when
+            the validators are expensive; for plain type checks it is slower
+            than validating. Use this only when validation, including any
+            ``default=`` factories, is deterministic and has no side effects:
+            a hit returns a copy of the stored result without calling them
+            again. Disabled by default.
         """
         self.schema: typing.Any = schema
         self.required = required
         self.extra = int(extra)  # ensure the value is an integer
+        self.cache_size = cache_size
+        self._cache: typing.Optional[collections.OrderedDict] = (
+            collections.OrderedDict() if cache_size > 0 else None
+        )
+        self._compile_cache: typing.Optional[typing.Dict[tuple, tuple]] = {}
         self._compiled = self._compile(schema)
+        # Validators such as Union(discriminant=...) compile schemas while
+        # validating; those must not pile up for the life of the schema.
+        self._compile_cache = None
 
     @classmethod
     def infer(cls, data, **kwargs) -> Schema:
@@ -202,6 +305,8 @@ class Schema(object):
     def __call__(self, data):
         """Validate data against this schema."""
         try:
+            if self._cache is not None:
+                return self._call_cached(self._cache, data)
             return self._compiled([], data)
         except er.MultipleInvalid:
             raise
@@ -209,13 +314,75 @@ class Schema(object):
             raise er.MultipleInvalid([e])
             # return self.validate([], self.schema, data)
 
+    def is_valid(self, data) -> bool:
+        """Return whether data passes this schema, without raising.
+
+        The validated value and any error details are discarded.
+
+        >>> validator = Schema({'name': str})
+        >>> validator.is_valid({'name': 'Alice'})
+        True
+        >>> validator.is_valid({'name': 42})
+        False
+        """
+        try:
+            self._compiled([], data)
+        except er.Invalid:
+            return False
+        return True
+
+    def _call_cached(self, cache, data):
+        try:
+            key = _freeze(data)
+        except TypeError:
+            return self._compiled([], data)
+
+        try:
+            result = cache.pop(key)
+        except KeyError:
+            result = self._compiled([], data)
+            try:
+                stored = copy.deepcopy(result)
+            except Exception:
+                # Validators may return objects that can't be copied (locks,
+                # sockets, ...); those results simply aren't cached.
+                return result
+            while len(cache) >= self.cache_size:
+                try:
+                    cache.popitem(last=False)
+                except KeyError:
+                    break
+            cache[key] = stored
+            return result
+        # Hand out copies so callers can't mutate the cached result.
+        cache[key] = result
+        return copy.deepcopy(result)
+
     def _compile(self, schema):
+        compile_name = self._compile_by_type.get(type(schema))
+        if compile_name is not None:
+            compile_cache = self._compile_cache
+            if compile_cache is None:
+                return getattr(self, compile_name)(schema)
+            # A container used in several places is only compiled once.
+            # Sub-validators such as Any(..., required=True) change
+            # self.required while compiling, so it is part of the key. The
+            # schema is kept with its validator so a reused id() can't match.
+            cache_key = (id(schema), self.required)
+            cached = compile_cache.get(cache_key)
+            if cached is not None and cached[0] is schema:
+                return cached[1]
+            compiled = getattr(self, compile_name)(schema)
+            compile_cache[cache_key] = (schema, compiled)
+            return compiled
         if schema is Extra:
             return lambda _, v: v
         if schema is Self:
             return lambda p, v: self._compiled(p, v)
         elif hasattr(schema, "__voluptuous_compile__"):
             return schema.__voluptuous_compile__(self)
+        if isinstance(schema, Marker) and type(schema).__call__ is Marker.__call__:
+            return _compile_marker(schema)
         if isinstance(schema, Object):
             return self._compile_object(schema)
         if isinstance(schema, collections.abc.Mapping):
@@ -229,7 +396,7 @@ class Schema(object):
         type_ = type(schema)
         if inspect.isclass(schema):
             type_ = schema
-        if type_ in (*primitive_types, object, type(None)) or callable(schema):
+        if type_ in _scalar_type_set or callable(schema):
             return _compile_scalar(schema)
         raise er.SchemaError('unsupported schema data type %r' % type(schema).__name__)
 
@@ -248,11 +415,12 @@ class Schema(object):
             )
         )
 
-        # Keys that may have defaults
-        all_default_keys = set(
+        # Keys with a default to insert when they are missing from the data
+        all_default_keys = tuple(
             key
             for key in schema
-            if isinstance(key, Required) or isinstance(key, Optional)
+            if isinstance(key, (Required, Optional))
+            and not isinstance(key.default, Undefined)
         )
 
         _compiled_schema = {}
@@ -269,18 +437,28 @@ class Schema(object):
         additional_candidates = []
         candidates_by_key = {}
         for skey, (ckey, cvalue) in candidates:
-            if type(skey) in primitive_types:
-                candidates_by_key.setdefault(skey, []).append((skey, (ckey, cvalue)))
-            elif isinstance(skey, Marker) and type(skey.schema) in primitive_types:
+            if type(skey) in _literal_type_set:
+                candidates_by_key.setdefault(skey, []).append((skey, ckey, cvalue))
+            elif isinstance(skey, Marker) and type(skey.schema) in _literal_type_set:
                 candidates_by_key.setdefault(skey.schema, []).append(
-                    (skey, (ckey, cvalue))
+                    (skey, ckey, cvalue)
                 )
             else:
                 # These are wildcards such as 'int', 'str', 'Remove' and others which should be applied to all keys
-                additional_candidates.append((skey, (ckey, cvalue)))
+                additional_candidates.append((skey, ckey, cvalue))
+
+        # Append the wildcards to every literal key's candidates up front, so
+        # matching a key in validate_mapping takes a single dict lookup.
+        additional_candidates = tuple(additional_candidates)
+        candidates_by_key = {
+            key: tuple(key_candidates) + additional_candidates
+            for key, key_candidates in candidates_by_key.items()
+        }
+        candidates_for_key = candidates_by_key.get
 
         def validate_mapping(path, iterable, out):
             required_keys = all_required_keys.copy()
+            extra = self.extra
 
             # Build a map of all provided key-value pairs.
             # The type(out) is used to retain ordering in case a ordered
@@ -291,10 +469,7 @@ class Schema(object):
 
             # Insert default values for non-existing keys.
             for key in all_default_keys:
-                if (
-                    not isinstance(key.default, Undefined)
-                    and key.schema not in key_value_map
-                ):
+                if key.schema not in key_value_map:
                     # A default value has been specified for this missing
                     # key, insert it.
                     key_value_map[key.schema] = key.default()
@@ -305,14 +480,12 @@ class Schema(object):
                 remove_key = False
 
                 # Optimization. Validate against the matching key first, then fallback to the rest
-                relevant_candidates = itertools.chain(
-                    candidates_by_key.get(key, []), additional_candidates
-                )
+                relevant_candidates = candidates_for_key(key, additional_candidates)
 
                 # compare each given key/value against all compiled key/values
-                # schema key, (compiled key, compiled value)
+                # schema key, compiled key, compiled value
                 error = None
-                for skey, (ckey, cvalue) in relevant_candidates:
+                for skey, ckey, cvalue in relevant_candidates:
                     try:
                         new_key = ckey(key_path, key)
                     except er.Invalid as e:
@@ -362,11 +535,11 @@ class Schema(object):
                     if remove_key:
                         # remove key
                         continue
-                    elif self.extra == ALLOW_EXTRA:
+                    elif extra == ALLOW_EXTRA:
                         out[key] = value
                     elif error:
                         errors.append(error)
-                    elif self.extra != REMOVE_EXTRA:
+                    elif extra != REMOVE_EXTRA:
                         errors.append(er.Invalid('extra keys not allowed', key_path))
                         # else REMOVE_EXTRA: ignore the key so it's removed from output
 
@@ -409,7 +582,7 @@ class Schema(object):
             if schema.cls is not UNDEFINED and not isinstance(data, schema.cls):
                 raise er.ObjectInvalid('expected a {0!r}'.format(schema.cls), path)
             iterable = _iterate_object(data)
-            iterable = filter(lambda item: item[1] is not None, iterable)
+            iterable = (item for item in iterable if item[1] is not None)
             out = base_validate(path, iterable, {})
             return type(data)(**out)
 
@@ -545,7 +718,7 @@ class Schema(object):
             if errors:
                 raise er.MultipleInvalid(errors)
 
-            out = data.__class__()
+            out = {} if type(data) is dict else data.__class__()
             return base_validate(path, data.items(), out)
 
         return validate_dict
@@ -564,46 +737,101 @@ class Schema(object):
         [1]
         """
         _compiled = [self._compile(s) for s in schema]
-        seq_type_name = seq_type.__name__
-
-        def validate_sequence(path, data):
-            if not isinstance(data, seq_type):
-                raise er.SequenceTypeInvalid('expected a %s' % seq_type_name, path)
+        seq_type_msg = 'expected a %s' % seq_type.__name__
+
+        # Literal values at the start of the schema are matched in one step;
+        # only values not found there are tried against the rest of the
+        # validators, in order. A handful of literals is scanned as a tuple,
+        # which needs no hashing, larger runs are looked up in a frozenset.
+        literals = []
+        for s in schema:
+            if type(s) not in _primitive_type_set or s != s:
+                break
+            literals.append(s)
+        literal_values: typing.Union[tuple, frozenset] = (
+            tuple(literals) if len(literals) <= 7 else frozenset(literals)
+        )
+        _compiled_rest = _compiled[len(literals) :]
 
+        if not schema:
             # Empty seq schema, reject any data.
-            if not schema:
+            def validate_empty_sequence(path, data):
+                if not isinstance(data, seq_type):
+                    raise er.SequenceTypeInvalid(seq_type_msg, path)
                 if data:
                     raise er.MultipleInvalid(
                         [er.ValueInvalid('not a valid value', path if path else data)]
                     )
                 return data
 
+            return validate_empty_sequence
+
+        item_type = schema[0] if len(schema) == 1 else None
+        if (
+            inspect.isclass(item_type)
+            and not hasattr(item_type, '__voluptuous_compile__')
+            and type(self)._compile is Schema._compile
+        ):
+            # A single class, as in [int]: check each item inline instead of
+            # going through the compiled validator and its try/except. Only
+            # done when _compile isn't overridden, as it may not compile
+            # classes to an isinstance() check.
+            item_msg = 'expected %s' % item_type.__name__
+
+            def validate_typed_sequence(path, data):
+                if not isinstance(data, seq_type):
+                    raise er.SequenceTypeInvalid(seq_type_msg, path)
+                errors = [
+                    er.TypeInvalid(item_msg, path + [i])
+                    for i, value in enumerate(data)
+                    if not isinstance(value, item_type)
+                ]
+                if errors:
+                    raise er.MultipleInvalid(errors)
+                # do not include Remove values
+                out = [value for value in data if value is not Remove]
+                return _rebuild_sequence(data, out)
+
+            return validate_typed_sequence
+
+        def validate_sequence(path, data):
+            if not isinstance(data, seq_type):
+                raise er.SequenceTypeInvalid(seq_type_msg, path)
+
             out = []
+            append = out.append
             invalid = None
             errors = []
             index_path = UNDEFINED
             for i, value in enumerate(data):
+                if literal_values:
+                    try:
+                        if value in literal_values:
+                            append(value)
+                            continue
+                    except TypeError:
+                        # unhashable values can't be one of the literals
+                        pass
                 index_path = path + [i]
                 invalid = None
-                for validate in _compiled:
+                for validate in _compiled_rest:
                     try:
                         cval = validate(index_path, value)
                         if cval is not Remove:  # do not include Remove values
-                            out.append(cval)
+                            append(cval)
                         break
                     except er.Invalid as e:
                         if len(e.path) > len(index_path):
                             raise
                         invalid = e
                 else:
-                    errors.append(invalid)
+                    errors.append(
+                        invalid or er.ScalarInvalid('not a valid value', index_path)
+                    )
             if errors:
                 raise er.MultipleInvalid(errors)
 
-            if _isnamedtuple(data):
-                return type(data)(*out)
-            else:
-                return type(data)(out)
+            return _rebuild_sequence(data, out)
 
         return validate_sequence
 
@@ -651,13 +879,14 @@ class Schema(object):
         ...   validator(set(['a']))
         """
         type_ = type(schema)
-        type_name = type_.__name__
+        type_msg = 'expected a %s' % type_.__name__
+        invalid_msg = 'invalid value in %s' % type_.__name__
+        _compiled = [self._compile(s) for s in schema]
 
         def validate_set(path, data):
             if not isinstance(data, type_):
-                raise er.Invalid('expected a %s' % type_name, path)
+                raise er.Invalid(type_msg, path)
 
-            _compiled = [self._compile(s) for s in schema]
             errors = []
             for value in data:
                 for validate in _compiled:
@@ -667,7 +896,7 @@ class Schema(object):
                     except er.Invalid:
                         pass
                 else:
-                    invalid = er.Invalid('invalid value in %s' % type_name, path)
+                    invalid = er.Invalid(invalid_msg, path)
                     errors.append(invalid)
 
             if errors:
@@ -696,9 +925,8 @@ class Schema(object):
         :param extra: if set, overrides `extra` of this `Schema`
         """
 
-        assert isinstance(self.schema, dict) and isinstance(
-            schema, dict
-        ), 'Both schemas must be dictionary-based'
+        if not (isinstance(self.schema, dict) and isinstance(schema, dict)):
+            raise AssertionError('Both schemas must be dictionary-based')
 
         result = self.schema.copy()
 
@@ -739,7 +967,12 @@ class Schema(object):
         result_cls = type(self)
         result_required = required if required is not None else self.required
         result_extra = extra if extra is not None else self.extra
-        return result_cls(result, required=result_required, extra=result_extra)
+        return result_cls(
+            result,
+            required=result_required,
+            extra=result_extra,
+            cache_size=self.cache_size,
+        )
 
 
 def _compile_scalar(schema):
@@ -762,12 +995,12 @@ def _compile_scalar(schema):
     ...   _compile_scalar(lambda v: float(v))([], 'a')
     """
     if inspect.isclass(schema):
+        msg = 'expected %s' % schema.__name__
 
         def validate_instance(path, data):
             if isinstance(data, schema):
                 return data
             else:
-                msg = 'expected %s' % schema.__name__
                 raise er.TypeInvalid(msg, path)
 
         return validate_instance
@@ -793,6 +1026,38 @@ def _compile_scalar(schema):
     return validate_value
 
 
+def _compile_marker(marker):
+    """A marker, usually a mapping key such as Required('name').
+
+    Runs the marker's own compiled schema directly, raising the same errors
+    as calling the marker through _compile_scalar would.
+
+    >>> _compile_marker(Required('name'))([], 'name')
+    'name'
+    >>> with raises(er.MultipleInvalid, "not a valid value @ data['key']"):
+    ...   _compile_marker(Required('name'))(['key'], 'other')
+    >>> with raises(er.Invalid, "bad key @ data['key']"):
+    ...   _compile_marker(Required('name', msg='bad key'))(['key'], 'other')
+    """
+    inner = marker._schema._compiled
+    msg = marker.msg
+
+    def validate_marker(path, data):
+        try:
+            return inner([], data)
+        except er.Invalid as e:
+            if not isinstance(e, er.MultipleInvalid):
+                e = er.MultipleInvalid([e])
+            if msg and len(e.path) <= 1:
+                e = er.Invalid(msg)
+            e.prepend(path)
+            raise e
+        except ValueError:
+            raise er.ValueInvalid('not a valid value', path)
+
+    return validate_marker
+
+
 def _compile_itemsort():
     '''return sort function of mappings'''
 
@@ -870,6 +1135,17 @@ def _iterate_object(obj):
                 yield (key, getattr(obj, key))
 
 
+def _as_schema(schema, **kwargs) -> Schema:
+    """Return ``schema`` wrapped in a Schema, reusing it if it already is one.
+
+    A Schema wrapping another Schema only treats it as a callable, so the
+    extra layer (and its options) would not change the result.
+    """
+    if type(schema) is Schema:
+        return schema
+    return Schema(schema, **kwargs)
+
+
 class Msg(object):
     """Report a user-friendly message if a schema fails to validate.
 
@@ -910,7 +1186,7 @@ class Msg(object):
                 "Msg can only use subclases of Invalid as custom class"
             )
         self._schema = schema
-        self.schema = Schema(schema)
+        self.schema = _as_schema(schema)
         self.msg = msg
         self.cls = cls
 
@@ -959,7 +1235,7 @@ class Marker(object):
         description: typing.Any | None = None,
     ) -> None:
         self.schema: typing.Any = schema_
-        self._schema = Schema(schema_)
+        self._schema = _as_schema(schema_)
         self.msg = msg
         self.description = description
         self.__hash__ = cache(lambda: hash(schema_))  # type: ignore[method-assign]
@@ -1013,6 +1289,8 @@ class Optional(Marker):
     {'key2': 'value'}
     """
 
+    __slots__ = ('default',)
+
     def __init__(
         self,
         schema: Schemable,
@@ -1060,6 +1338,8 @@ class Exclusive(Optional):
     ...             'social': {'social_network': 'barfoo', 'token': 'tEMp'}})
     """
 
+    __slots__ = ('group_of_exclusion',)
+
     def __init__(
         self,
         schema: Schemable,
@@ -1113,6 +1393,8 @@ class Inclusive(Optional):
     True
     """
 
+    __slots__ = ('group_of_inclusion',)
+
     def __init__(
         self,
         schema: Schemable,
@@ -1142,6 +1424,8 @@ class Required(Marker):
     {'key': []}
     """
 
+    __slots__ = ('default',)
+
     def __init__(
         self,
         schema: Schemable,
@@ -1168,6 +1452,8 @@ class Remove(Marker):
     [1, 2, 3, 5, '7']
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         schema_: Schemable,
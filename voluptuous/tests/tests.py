@@ -3,6 +3,7 @@ import collections
 import copy
 import os
 import sys
+import threading
 from enum import Enum
 
 import pytest
@@ -11,10 +12,10 @@ from voluptuous import (
     ALLOW_EXTRA, PREVENT_EXTRA, All, AllInvalid, Any, Clamp, Coerce, Contains,
     ContainsInvalid, Date, Datetime, Email, EmailInvalid, Equal, ExactSequence,
     Exclusive, Extra, FqdnUrl, In, Inclusive, InInvalid, Invalid, IsDir, IsFile, Length,
-    Literal, LiteralInvalid, Marker, Match, MatchInvalid, Maybe, MultipleInvalid, NotIn,
+    Literal, LiteralInvalid, Marker, Match, MatchInvalid, Maybe, Msg, MultipleInvalid, NotIn,
     NotInInvalid, Number, Object, Optional, PathExists, Range, Remove, Replace,
-    Required, Schema, Self, SomeOf, TooManyValid, TypeInvalid, Union, Unordered, Url,
-    UrlInvalid, raises, validate,
+    Required, ScalarInvalid, Schema, Self, SomeOf, TooManyValid, TypeInvalid, Union,
+    Unordered, Url, UrlInvalid, raises, validate,
 )
 from voluptuous.humanize import humanize_error
 from voluptuous.util import Capitalize, Lower, Strip, Title, Upper
@@ -66,15 +67,18 @@ def test_iterate_candidates():
     assert _iterate_mapping_candidates(schema)[0][0] == 'toaster'
 
 
+COLORS = frozenset(["red", "blue", "yellow"])
+COLOR_SCHEMA = Schema({"color": In(COLORS)})
+
+
 def test_in():
     """Verify that In works."""
-    schema = Schema({"color": In(frozenset(["red", "blue", "yellow"]))})
-    schema({"color": "blue"})
+    COLOR_SCHEMA({"color": "blue"})
     with pytest.raises(
         MultipleInvalid,
         match=r"value must be one of \['blue', 'red', 'yellow'\] for dictionary value @ data\['color'\]",
     ) as ctx:
-        schema({"color": "orange"})
+        COLOR_SCHEMA({"color": "orange"})
     assert len(ctx.value.errors) == 1
     assert isinstance(ctx.value.errors[0], InInvalid)
 
@@ -286,7 +290,13 @@ def test_email_validation_without_host():
 
 
 @pytest.mark.parametrize(
-    'input_value', ['john@voluptuous.com>', 'john!@voluptuous.org!@($*!']
+    'input_value',
+    [
+        'john@voluptuous.com>',
+        'john!@voluptuous.org!@($*!',
+        '\u212aate@voluptuous.com',
+        'john@volupt\u0131ous.com',
+    ],
 )
 def test_email_validation_with_bad_data(input_value: str):
     """Test with bad data in email address"""
@@ -443,6 +453,188 @@ def test_schema_extend_handles_schema_subclass():
     assert isinstance(extended, S)
 
 
+def test_schema_cache():
+    calls = []
+
+    def count(v):
+        calls.append(v)
+        return v
+
+    schema = Schema({'a': count, Optional('b'): [int]}, cache_size=2)
+    result = schema({'a': 1, 'b': [1, 2]})
+    assert result == {'a': 1, 'b': [1, 2]}
+    result['b'].append(3)
+    assert schema({'a': 1, 'b': [1, 2]}) == {'a': 1, 'b': [1, 2]}
+    assert calls == [1]
+
+    # Equal values of different types are cached separately.
+    schema({'a': True})
+    schema({'a': 1.0})
+    assert calls == [1, True, 1.0]
+    assert type(schema({'a': True})['a']) is bool
+
+    # The least recently used entry is evicted.
+    schema({'a': 1})
+    assert calls == [1, True, 1.0, 1]
+
+    # Failures and uncacheable data are always validated.
+    for _ in range(2):
+        with pytest.raises(MultipleInvalid):
+            schema({'a': 1, 'b': ['x']})
+        schema({'a': object()})
+    assert len(calls) == 8
+
+
+def test_schema_cache_keeps_signed_zeros_apart():
+    schema = Schema(Any(float, complex), cache_size=4)
+    for value in (0.0, -0.0, 0.0, complex(0.0, 0.0), complex(0.0, -0.0)):
+        result = schema(value)
+        assert result == value
+        assert repr(result) == repr(value)
+    assert str(Schema({'a': float}, cache_size=4)({'a': -0.0})['a']) == '-0.0'
+
+
+def test_schema_cache_skips_uncopyable_results():
+    class Handle(object):
+        def __init__(self, value):
+            self.value = value
+            self.lock = threading.Lock()
+
+    schema = Schema({'a': Coerce(Handle)}, cache_size=4)
+    first = schema({'a': 1})
+    second = schema({'a': 1})
+    assert first['a'].value == second['a'].value == 1
+    assert first['a'] is not second['a']
+
+
+def test_schema_cache_self_referencing_data():
+    looped_list = []
+    looped_list.append(looped_list)
+    looped_dict = {}
+    looped_dict['self'] = looped_dict
+    assert Schema(list, cache_size=4)(looped_list) is looped_list
+    assert Schema(dict, cache_size=4)(looped_dict) is looped_dict
+    shared = [1]
+    assert Schema([[int]], cache_size=4)([shared, shared]) == [[1], [1]]
+
+
+def test_schema_cache_disabled_by_default():
+    assert Schema(int).cache_size == 0
+    assert Schema({'a': int}).extend({'b': int}).cache_size == 0
+
+
+def test_schema_extend_keeps_cache_size():
+    base = Schema({'a': int}, cache_size=4)
+    extended = base.extend({'b': int})
+    assert extended.cache_size == 4
+    assert extended({'a': 1, 'b': 2}) == {'a': 1, 'b': 2}
+    assert extended({'a': 1, 'b': 2}) == {'a': 1, 'b': 2}
+    assert base({'a': 1}) == {'a': 1}
+
+
+def test_none_keys_match_literally():
+    schema = Schema({None: int, Optional('a'): str, Extra: str})
+    assert schema({None: 1, 'a': 'x', 'b': 'y'}) == {None: 1, 'a': 'x', 'b': 'y'}
+    with pytest.raises(MultipleInvalid) as ctx:
+        schema({None: 'x'})
+    assert ctx.value.errors[0].path == [None]
+    assert Schema({Required(None): int})({None: 2}) == {None: 2}
+    with pytest.raises(MultipleInvalid, match='required key not provided'):
+        Schema({Required(None): int})({})
+
+
+def test_shared_subschema_compiled_once():
+    compiled = []
+
+    class CountingSchema(Schema):
+        def _compile_dict(self, schema):
+            compiled.append(schema)
+            return super()._compile_dict(schema)
+
+    address = {'street': str, 'city': str}
+    schema = CountingSchema({'home': address, 'work': address, 'old': [address]})
+    assert compiled.count(address) == 1
+    data = {'home': {'street': 'a', 'city': 'b'}, 'work': {'street': 'c', 'city': 'd'}}
+    assert schema(data) == data
+    with pytest.raises(MultipleInvalid) as ctx:
+        schema({'old': [{'street': 1}]})
+    assert ctx.value.errors[0].path == ['old', 0, 'street']
+
+
+def test_marker_keys():
+    schema = Schema({Optional(str, msg='keys must be str'): int, Required('a'): int})
+    assert schema({'a': 1, 'b': 2}) == {'a': 1, 'b': 2}
+    with pytest.raises(MultipleInvalid) as ctx:
+        schema({'a': 1, 2: 3})
+    assert [(str(e), e.path) for e in ctx.value.errors] == [
+        ('keys must be str @ data[2]', [2])
+    ]
+
+    class UpperKey(Optional):
+        def __call__(self, v):
+            return super().__call__(v).upper()
+
+    assert Schema({UpperKey('a'): int})({'a': 1}) == {'A': 1}
+
+
+def test_shared_subschema_compiled_per_required():
+    addr = {'street': str}
+    for schema in (
+        Schema({'a': addr, 'b': Any(addr, None, required=True)}),
+        Schema({'b': Any(addr, None, required=True), 'a': addr}),
+    ):
+        assert schema({'a': {}, 'b': {'street': 'x'}}) == {
+            'a': {},
+            'b': {'street': 'x'},
+        }
+        with pytest.raises(MultipleInvalid, match="required key not provided"):
+            schema({'a': {}, 'b': {}})
+
+
+def test_compile_cache_released_after_init():
+    schema = Schema(
+        Union(
+            {'type': 'a', 'v': int},
+            {'type': 'b', 'v': str},
+            discriminant=lambda val, alt: [{'type': val['type'], 'v': int}],
+        )
+    )
+    for _ in range(10):
+        assert schema({'type': 'a', 'v': 1}) == {'type': 'a', 'v': 1}
+    assert not schema._compile_cache
+
+
+class CoercingSchema(Schema):
+    def _compile(self, schema):
+        if schema is int:
+            return lambda path, value: int(value)
+        if schema is str:
+            return lambda path, value: str(value).strip()
+        return super()._compile(schema)
+
+
+def test_subclass_compile_used_for_single_class_sequence():
+    assert CoercingSchema({'a': [int]})({'a': ['1', 2]}) == {'a': [1, 2]}
+
+
+def test_subclass_compile_used_for_all_of_classes():
+    assert CoercingSchema(All(int))('1') == 1
+    assert CoercingSchema(All(str))(' x ') == 'x'
+
+
+def test_subclass_compile_used_for_any_of_classes():
+    assert CoercingSchema(Any(str, None))(' x ') == 'x'
+
+
+def test_schema_is_valid():
+    schema = Schema({Required('a'): All(int, Range(min=0)), 'b': [str]})
+    assert schema.is_valid({'a': 1, 'b': ['x']})
+    assert not schema.is_valid({'a': -1})
+    assert not schema.is_valid({'b': ['x']})
+    assert not schema.is_valid({'a': 1, 'c': None})
+    assert not schema.is_valid('a')
+
+
 def test_equality():
     assert Schema('foo') == Schema('foo')
 
@@ -546,6 +738,26 @@ def test_list_validation_messages():
     assert str(ctx.value.errors[0]) == "3 is not even @ data['even_numbers'][0]"
 
 
+def test_list_literals_then_validators():
+    """Literal members are matched before the validators that follow them."""
+    schema = Schema(['one', 'two', 3, Coerce(int)])
+    assert schema(['one', 3, 'two', '4', 3.0]) == ['one', 3, 'two', 4, 3.0]
+
+    with pytest.raises(MultipleInvalid, match=r"expected int @ data\[1\]"):
+        schema(['one', [1]])
+
+    schema = Schema(['one', 'two'])
+    with pytest.raises(MultipleInvalid, match=r"not a valid value @ data\[1\]") as ctx:
+        schema(['one', 'three', {}])
+    assert len(ctx.value.errors) == 2
+    assert all(isinstance(e, ScalarInvalid) for e in ctx.value.errors)
+
+    schema = Schema(list(range(10)) + [list])
+    assert schema([9, 0, [1]]) == [9, 0, [1]]
+    with pytest.raises(MultipleInvalid, match=r"expected list @ data\[0\]"):
+        schema([10])
+
+
 def test_nested_multiple_validation_errors():
     """Make sure useful error messages are available"""
 
@@ -1573,6 +1785,78 @@ def test_any_required_with_subschema():
         schema({})
 
 
+def test_single_type_sequence():
+    assert Schema([int])([1, 2]) == [1, 2]
+    assert Schema((str,))(('a', 'b')) == ('a', 'b')
+    assert Schema([type])([int, Remove, str]) == [int, str]
+    with pytest.raises(MultipleInvalid) as ctx:
+        Schema([int])([1, 'a', 2.5])
+    assert [(str(e), e.path) for e in ctx.value.errors] == [
+        ('expected int @ data[1]', [1]),
+        ('expected int @ data[2]', [2]),
+    ]
+    assert isinstance(ctx.value.errors[0], TypeInvalid)
+
+
+def test_any_and_all_called_directly():
+    """Any and All can be used as plain callables outside of a Schema."""
+    any_ = Any(int, 'a')
+    all_ = All(str, Length(min=2))
+    for _ in range(2):
+        assert any_(1) == 1
+        assert any_('a') == 'a'
+        assert all_('ab') == 'ab'
+        with pytest.raises(Invalid):
+            any_('b')
+        with pytest.raises(Invalid):
+            all_('a')
+
+
+def test_existing_schema_is_reused_by_wrappers():
+    inner = Schema({'a': int})
+    assert Msg(inner, 'bad').schema is inner
+    assert Required(inner)._schema is inner
+    assert Unordered([inner], required=True)._schemas[0] is inner
+    any_ = Any(inner, None)
+    assert any_({'a': 1}) == {'a': 1}
+    assert any_._schemas[0] is inner
+    with pytest.raises(Invalid):
+        any_({'a': 'x'})
+
+
+def test_any_and_all_of_types():
+    any_schema = Schema({'a': Any(int, str)})
+    assert any_schema({'a': 1}) == {'a': 1}
+    assert any_schema({'a': 'x'}) == {'a': 'x'}
+    with pytest.raises(MultipleInvalid, match=r"expected int for dictionary value"):
+        any_schema({'a': 1.5})
+
+    all_schema = Schema({'a': All(int, object)})
+    assert all_schema({'a': 1}) == {'a': 1}
+    with pytest.raises(MultipleInvalid, match=r"expected int for dictionary value"):
+        all_schema({'a': 'x'})
+
+    msg_schema = Schema(Any(int, str, msg='int or str'))
+    with pytest.raises(MultipleInvalid, match=r"^int or str$"):
+        msg_schema(1.5)
+
+
+def test_any_of_types_and_literals():
+    schema = Schema(Any(None, 'auto', int))
+    assert schema(None) is None
+    assert schema('auto') == 'auto'
+    assert schema(3) == 3
+    with pytest.raises(MultipleInvalid, match=r"^not a valid value$"):
+        schema('manual')
+    with pytest.raises(MultipleInvalid):
+        schema(['auto'])
+
+    nan = float('nan')
+    assert Schema(Any(nan, 'x'))('x') == 'x'
+    with pytest.raises(MultipleInvalid):
+        Schema(Any(nan, 'x'))(float('nan'))
+
+
 def test_inclusive():
     schema = Schema(
         {
@@ -18,7 +18,14 @@ from voluptuous.error import (
 )
 
 # F401: flake8 complains about 'raises' not being used, but it is used in doctests
-from voluptuous.schema_builder import Schema, Schemable, message, raises  # noqa: F401
+from voluptuous.schema_builder import (  # noqa: F401
+    Schema,
+    Schemable,
+    _as_schema,
+    _literal_type_set,
+    message,
+    raises,
+)
 
 if typing.TYPE_CHECKING:
     from _typeshed import SupportsAllComparisons
@@ -53,7 +60,7 @@ USER_REGEX = re.compile(
     r"""\\[\001-\011\013\014\016-\177])*"$)"""
     # end anchor, because fullmatch is not available in python 2.7
     r")\Z",
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 DOMAIN_REGEX = re.compile(
     # start anchor, because fullmatch is not available in python 2.7
@@ -67,10 +74,18 @@ DOMAIN_REGEX = re.compile(
     r'(\.(25[0-5]|2[0-4]\d|[0-1]?\d?\d)){3}\]$'
     # end anchor, because fullmatch is not available in python 2.7
     r")\Z",
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 # fmt: on
 
+# Accepted string spellings for Boolean(), compared after lower-casing.
+# fmt: off
+_BOOLEAN_VALUES = {
+    '1': True, 'true': True, 'yes': True, 'on': True, 'enable': True,
+    '0': False, 'false': False, 'no': False, 'off': False, 'disable': False,
+}
+# fmt: on
+
 __author__ = 'tusharmakkar08'
 
 
@@ -211,15 +226,49 @@ def Boolean(v):
     ...   assert isinstance(e.errors[0], BooleanInvalid)
     """
     if isinstance(v, basestring):
-        v = v.lower()
-        if v in ('1', 'true', 'yes', 'on', 'enable'):
-            return True
-        if v in ('0', 'false', 'no', 'off', 'disable'):
-            return False
-        raise ValueError
+        result = _BOOLEAN_VALUES.get(v.lower())
+        if result is None:
+            raise ValueError
+        return result
     return bool(v)
 
 
+def _plain_types(validators: typing.Iterable) -> typing.Optional[tuple]:
+    """Return the validators as a tuple if they are all plain classes.
+
+    Such validators compile to a bare isinstance() check, so callers can
+    test them all at once before falling back to the general path.
+    """
+    types = tuple(validators)
+    if types and all(
+        isinstance(v, type) and not hasattr(v, '__voluptuous_compile__') for v in types
+    ):
+        return types
+    return None
+
+
+def _types_and_literals(
+    validators: typing.Iterable,
+) -> typing.Optional[typing.Tuple[tuple, frozenset]]:
+    """Split validators into plain classes and hashable literals.
+
+    Returns None if any validator is something else, or a literal that
+    doesn't equal itself (NaN).
+    """
+    types = []
+    literals = []
+    for v in validators:
+        if isinstance(v, type) and not hasattr(v, '__voluptuous_compile__'):
+            types.append(v)
+        elif type(v) in _literal_type_set and v == v:
+            literals.append(v)
+        else:
+            return None
+    if not types and not literals:
+        return None
+    return tuple(types), frozenset(literals)
+
+
 class _WithSubValidators(object):
     """Base class for validators that use sub-validators.
 
@@ -235,6 +284,7 @@ class _WithSubValidators(object):
         self.msg = msg
         self.required = required
         self.discriminant = discriminant
+        self._schemas: typing.Optional[typing.List[Schema]] = None
 
     def __voluptuous_compile__(self, schema: Schema) -> typing.Callable:
         self._compiled = []
@@ -256,7 +306,9 @@ class _WithSubValidators(object):
         return self._exec(self._compiled, value, path)
 
     def __call__(self, v):
-        return self._exec((Schema(val) for val in self.validators), v)
+        if self._schemas is None:
+            self._schemas = [_as_schema(val) for val in self.validators]
+        return self._exec(self._schemas, v)
 
     def __repr__(self):
         return '%s(%s, msg=%r)' % (
@@ -299,21 +351,51 @@ class Any(_WithSubValidators):
     ...   validate(4)
     """
 
+    def __voluptuous_compile__(self, schema: Schema) -> typing.Callable:
+        run = super().__voluptuous_compile__(schema)
+        plain = _types_and_literals(self.validators)
+        if (
+            plain is None
+            or self.discriminant is not None
+            or type(schema)._compile is not Schema._compile
+        ):
+            # A subclass may compile classes and literals differently, so it
+            # always takes the general path.
+            return run
+        types, literals = plain
+
+        def validate_any_plain(path, value):
+            if isinstance(value, types):
+                return value
+            try:
+                if value in literals:
+                    return value
+            except TypeError:
+                # unhashable values can't be one of the literals
+                pass
+            return run(path, value)
+
+        return validate_any_plain
+
     def _exec(self, funcs, v, path=None):
         error = None
-        for func in funcs:
-            try:
-                if path is None:
+        if path is None:
+            for func in funcs:
+                try:
                     return func(v)
-                else:
-                    return func(path, v)
-            except Invalid as e:
-                if error is None or len(e.path) > len(error.path):
-                    error = e
+                except Invalid as e:
+                    if error is None or len(e.path) > len(error.path):
+                        error = e
         else:
-            if error:
-                raise error if self.msg is None else AnyInvalid(self.msg, path=path)
-            raise AnyInvalid(self.msg or 'no valid value found', path=path)
+            for func in funcs:
+                try:
+                    return func(path, v)
+                except Invalid as e:
+                    if error is None or len(e.path) > len(error.path):
+                        error = e
+        if error:
+            raise error if self.msg is None else AnyInvalid(self.msg, path=path)
+        raise AnyInvalid(self.msg or 'no valid value found', path=path)
 
 
 # Convenience alias
@@ -343,19 +425,23 @@ class Union(_WithSubValidators):
 
     def _exec(self, funcs, v, path=None):
         error = None
-        for func in funcs:
-            try:
-                if path is None:
+        if path is None:
+            for func in funcs:
+                try:
                     return func(v)
-                else:
-                    return func(path, v)
-            except Invalid as e:
-                if error is None or len(e.path) > len(error.path):
-                    error = e
+                except Invalid as e:
+                    if error is None or len(e.path) > len(error.path):
+                        error = e
         else:
-            if error:
-                raise error if self.msg is None else AnyInvalid(self.msg, path=path)
-            raise AnyInvalid(self.msg or 'no valid value found', path=path)
+            for func in funcs:
+                try:
+                    return func(path, v)
+                except Invalid as e:
+                    if error is None or len(e.path) > len(error.path):
+                        error = e
+        if error:
+            raise error if self.msg is None else AnyInvalid(self.msg, path=path)
+        raise AnyInvalid(self.msg or 'no valid value found', path=path)
 
 
 # Convenience alias
@@ -375,12 +461,33 @@ class All(_WithSubValidators):
     10
     """
 
+    def __voluptuous_compile__(self, schema: Schema) -> typing.Callable:
+        run = super().__voluptuous_compile__(schema)
+        types = _plain_types(self.validators)
+        if (
+            types is None
+            or self.discriminant is not None
+            or type(schema)._compile is not Schema._compile
+        ):
+            # A subclass may compile classes to something other than an
+            # isinstance() check, so it always takes the general path.
+            return run
+
+        def validate_all_types(path, value):
+            for type_ in types:
+                if not isinstance(value, type_):
+                    return run(path, value)
+            return value
+
+        return validate_all_types
+
     def _exec(self, funcs, v, path=None):
         try:
-            for func in funcs:
-                if path is None:
+            if path is None:
+                for func in funcs:
                     v = func(v)
-                else:
+            else:
+                for func in funcs:
                     v = func(path, v)
         except Invalid as e:
             raise e if self.msg is None else AllInvalid(self.msg, path=path)
@@ -410,6 +517,8 @@ class Match(object):
     '0x123ef4'
     """
 
+    __slots__ = ('pattern', 'msg')
+
     def __init__(
         self, pattern: typing.Union[re.Pattern, str], msg: typing.Optional[str] = None
     ) -> None:
@@ -443,6 +552,8 @@ class Replace(object):
     'I say goodbye'
     """
 
+    __slots__ = ('pattern', 'substitution', 'msg')
+
     def __init__(
         self,
         pattern: typing.Union[re.Pattern, str],
@@ -466,8 +577,10 @@ class Replace(object):
         )
 
 
-def _url_validation(v: str) -> urlparse.ParseResult:
-    parsed = urlparse.urlparse(v)
+def _url_validation(v: str) -> urlparse.SplitResult:
+    # urlsplit is enough to get at the scheme and host; urlparse would also
+    # split the ;params off the path, which is never looked at here.
+    parsed = urlparse.urlsplit(v)
     if not parsed.scheme or not parsed.netloc:
         raise UrlInvalid("must have a URL scheme and host")
     return parsed
@@ -652,23 +765,23 @@ class Range(object):
 
     def __call__(self, v):
         try:
-            if self.min_included:
-                if self.min is not None and not v >= self.min:
-                    raise RangeInvalid(
-                        self.msg or 'value must be at least %s' % self.min
-                    )
-            else:
-                if self.min is not None and not v > self.min:
+            if self.min is not None:
+                if self.min_included:
+                    if not v >= self.min:
+                        raise RangeInvalid(
+                            self.msg or 'value must be at least %s' % self.min
+                        )
+                elif not v > self.min:
                     raise RangeInvalid(
                         self.msg or 'value must be higher than %s' % self.min
                     )
-            if self.max_included:
-                if self.max is not None and not v <= self.max:
-                    raise RangeInvalid(
-                        self.msg or 'value must be at most %s' % self.max
-                    )
-            else:
-                if self.max is not None and not v < self.max:
+            if self.max is not None:
+                if self.max_included:
+                    if not v <= self.max:
+                        raise RangeInvalid(
+                            self.msg or 'value must be at most %s' % self.max
+                        )
+                elif not v < self.max:
                     raise RangeInvalid(
                         self.msg or 'value must be lower than %s' % self.max
                     )
@@ -921,7 +1034,7 @@ class ExactSequence(object):
     ) -> None:
         self.validators = validators
         self.msg = msg
-        self._schemas = [Schema(val, **kwargs) for val in validators]
+        self._schemas = [_as_schema(val, **kwargs) for val in validators]
 
     def __call__(self, v):
         if not isinstance(v, (list, tuple)) or len(v) != len(self._schemas):
@@ -1035,7 +1148,7 @@ class Unordered(object):
     ) -> None:
         self.validators = validators
         self.msg = msg
-        self._schemas = [Schema(val, **kwargs) for val in validators]
+        self._schemas = [_as_schema(val, **kwargs) for val in validators]
 
     def __call__(self, v):
         if not isinstance(v, (list, tuple)):
@@ -1209,10 +1322,11 @@ class SomeOf(_WithSubValidators):
         max_valid: typing.Optional[int] = None,
         **kwargs,
     ) -> None:
-        assert min_valid is not None or max_valid is not None, (
-            'when using "%s" you should specify at least one of min_valid and max_valid'
-            % (type(self).__name__,)
-        )
+        if min_valid is None and max_valid is None:
+            raise AssertionError(
+                'when using "%s" you should specify at least one of min_valid and max_valid'
+                % (type(self).__name__,)
+            )
         self.min_valid = min_valid or 0
         self.max_valid = max_valid or len(validators)
         super(SomeOf, self).__init__(*validators, **kwargs)